@@ -2,15 +2,54 @@ import os
 
 from dotenv import load_dotenv
 from flask import Flask
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
 
 from .admin_routes import init_app as init_admin_routes
 from .auth_routes import init_app as init_auth_routes
 from .business_routes import init_app as init_business_routes
+from .decorators import load_current_user
+from .diagnostics import init_app as init_diagnostics
 from .extensions import db, migrate
 from .misc_routes import init_app as init_misc_routes
 from .user_routes import init_app as init_user_routes
 
 
+def _engine_options(database_uri):
+    """
+    Builds SQLAlchemy engine options for the configured database.
+
+    Pool sizes can be tuned per deployment with DB_POOL_SIZE,
+    DB_MAX_OVERFLOW, DB_POOL_TIMEOUT and DB_POOL_RECYCLE. Connections are
+    pinged before use and recycled every few minutes by default so idle
+    Postgres connections dropped by the host do not surface as request errors.
+    """
+
+    url = make_url(database_uri)
+
+    # In-memory SQLite (tests): every connection must share one database,
+    # so use a single static connection instead of a sized pool
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {
+            "poolclass": StaticPool,
+            "connect_args": {"check_same_thread": False},
+        }
+
+    options = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        "pool_pre_ping": True,
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "300")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "10")),
+    }
+
+    if url.get_backend_name() == "sqlite":
+        # Wait up to 30s for locks and allow pooled connections across threads
+        options["connect_args"] = {"timeout": 30, "check_same_thread": False}
+
+    return options
+
+
 def create_app():
     load_dotenv()
 
@@ -18,6 +57,9 @@ def create_app():
     app.secret_key = os.getenv("FLASK_SECRET_KEY", "easybook-dev-key")
     app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("DATABASE_URL", "sqlite:///easybook.db")
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config["PASSWORD_HASH_METHOD"] = os.getenv("PASSWORD_HASH_METHOD")
+
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = _engine_options(app.config["SQLALCHEMY_DATABASE_URI"])
 
     db.init_app(app)
     migrate.init_app(app, db)
@@ -25,10 +67,16 @@ def create_app():
     # Import models so Flask-Migrate sees metadata.
     from . import models  # noqa: F401
 
+    # Load the current user's role/account ID once per request
+    app.before_request(load_current_user)
+
     init_auth_routes(app)
     init_user_routes(app)
     init_business_routes(app)
     init_admin_routes(app)
     init_misc_routes(app)
 
+    # Debug-only warnings for views that run too many queries
+    init_diagnostics(app)
+
     return app
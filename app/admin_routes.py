@@ -1,23 +1,30 @@
 # Import datetime to compare appointment times (past vs future)
 from datetime import datetime
 
-# Flask utilities for routing, templates, form data, sessions, and redirects
-from flask import redirect, render_template, request, session, url_for
+# Lightweight attribute container for the current admin's display details
+from types import SimpleNamespace
+
+# Flask utilities for routing, templates, form data, the current user, the session, and redirects
+from flask import abort, g, redirect, render_template, request, session, url_for
 
 # SQLAlchemy helpers for building more complex queries
-from sqlalchemy import or_
+from sqlalchemy import case, func, not_, or_, update
 
-# joinedload allows eager loading of related data to avoid extra queries
-from sqlalchemy.orm import joinedload
+# selectinload eager-loads related data in one IN query (no JOIN row widening)
+from sqlalchemy.orm import selectinload
 
-# Custom decorator used to restrict routes to specific roles (admin here)
-from .decorators import require_role
+# Role-based access decorator and the lazily loaded current account
+from .decorators import current_account, require_role
 
 # Database instance used for committing changes
 from .extensions import db
 
-# Database models used in this file
-from .models import Account, Appointment
+# Database models used in this file, plus the indexed account search expression
+from .models import ACCOUNT_SEARCH_TEXT, Account, Appointment
+
+
+# Number of rows shown per page on admin list pages
+ADMIN_PAGE_SIZE = 50
 
 
 # This function registers all admin routes to the Flask app
@@ -30,18 +37,30 @@ def init_app(app):
     @require_role("admin")  # Only admins can access this route
     def admin_dashboard():
 
-        # Total number of accounts in the system
-        total_accounts = Account.query.count()
-
-        # Number of active accounts (not disabled)
-        active_accounts = Account.query.filter_by(is_active=True).count()
-
-        # Get the currently logged-in admin user
-        me = Account.query.get(session["account_id"]) if session.get("account_id") else None
+        # Total number of accounts and number of active (not disabled) accounts,
+        # counted together in one query with conditional aggregation
+        total_accounts, active_accounts = db.session.execute(
+            db.select(
+                func.count(Account.id),
+                # COUNT skips the NULLs from non-matching rows (and returns 0, not NULL, on an empty table)
+                func.count(case((Account.is_active, 1))),
+            )
+        ).one()
+
+        # Current admin's display details, stored in the session at login.
+        # Sessions from before names were stored fall back to loading the account.
+        if "first_name" in session:
+            me = SimpleNamespace(
+                id=g.account_id,
+                first_name=session["first_name"],
+                last_name=session.get("last_name", ""),
+            )
+        else:
+            me = current_account()
 
         # Load the 20 most recent appointments
-        # joinedload loads the associated user in the same query (performance optimization)
-        appointments = Appointment.query.options(joinedload(Appointment.user)) \
+        # selectinload fetches their users in one IN query, like the other admin lists
+        appointments = Appointment.query.options(selectinload(Appointment.user)) \
             .order_by(Appointment.start_at.desc()) \
             .limit(20) \
             .all()
@@ -71,20 +90,34 @@ def init_app(app):
 
         # If a search query exists, filter accounts by email, role, or name
         if q:
-            query = query.filter(
-                or_(
-                    Account.email.ilike(f"%{q}%"),
-                    Account.role.ilike(f"%{q}%"),
-                    Account.first_name.ilike(f"%{q}%"),
-                    Account.last_name.ilike(f"%{q}%"),
+            if db.engine.dialect.name == "postgresql":
+                # One predicate over the combined text, served by the
+                # ix_accounts_search_trgm trigram index (see migrations)
+                query = query.filter(ACCOUNT_SEARCH_TEXT.like(f"%{q}%"))
+            else:
+                query = query.filter(
+                    or_(
+                        Account.email.ilike(f"%{q}%"),
+                        Account.role.ilike(f"%{q}%"),
+                        Account.first_name.ilike(f"%{q}%"),
+                        Account.last_name.ilike(f"%{q}%"),
+                    )
                 )
-            )
 
-        # Retrieve accounts sorted by ID
-        accounts = query.order_by(Account.id.asc()).all()
+        # Retrieve one page of accounts sorted by ID
+        pagination = query.order_by(Account.id.asc()).paginate(
+            page=request.args.get("page", 1, type=int),
+            per_page=ADMIN_PAGE_SIZE,
+            error_out=False,
+        )
 
         # Render account management page
-        return render_template("admin_accounts.html", accounts=accounts, q=q)
+        return render_template(
+            "admin_accounts.html",
+            accounts=pagination.items,
+            pagination=pagination,
+            q=q,
+        )
 
 
     # -----------------------------
@@ -95,14 +128,21 @@ def init_app(app):
     def admin_toggle_account(account_id):
 
         # Prevent admin from disabling their own account
-        if session.get("account_id") == account_id:
+        if g.account_id == account_id:
             return redirect(url_for("admin_accounts"))
 
-        # Retrieve the account or return 404 if it doesn't exist
-        account = Account.query.get_or_404(account_id)
+        # Toggle account active state in a single UPDATE (no SELECT first)
+        result = db.session.execute(
+            update(Account)
+            .where(Account.id == account_id)
+            .values(is_active=not_(Account.is_active))
+            .execution_options(synchronize_session=False)
+        )
 
-        # Toggle account active state
-        account.is_active = not account.is_active
+        # No row matched, so the account doesn't exist
+        if result.rowcount == 0:
+            db.session.rollback()
+            abort(404)
 
         # Save change to database
         db.session.commit()
@@ -118,7 +158,7 @@ def init_app(app):
     def admin_update_role(account_id):
 
         # Prevent admin from changing their own role accidentally
-        if session.get("account_id") == account_id:
+        if g.account_id == account_id:
             return redirect(url_for("admin_accounts"))
 
         # Get new role from submitted form
@@ -128,9 +168,19 @@ def init_app(app):
         if new_role not in ("user", "business", "admin"):
             return redirect(url_for("admin_accounts"))
 
-        # Update role in database
-        account = Account.query.get_or_404(account_id)
-        account.role = new_role
+        # Update role in database with a single UPDATE
+        result = db.session.execute(
+            update(Account)
+            .where(Account.id == account_id)
+            .values(role=new_role)
+            .execution_options(synchronize_session=False)
+        )
+
+        # No row matched, so the account doesn't exist
+        if result.rowcount == 0:
+            db.session.rollback()
+            abort(404)
+
         db.session.commit()
 
         return redirect(url_for("admin_accounts"))
@@ -147,10 +197,11 @@ def init_app(app):
         q = request.args.get("q", "").strip().lower()
 
         # Base query: future appointments only
-        query = Appointment.query.options(joinedload(Appointment.user)) \
+        query = Appointment.query.options(selectinload(Appointment.user)) \
             .filter(Appointment.start_at >= datetime.now())
 
         # Apply search filter if provided
+        # (on Postgres each ILIKE is served by a per-column trigram index)
         if q:
             query = query.join(Account, Account.id == Appointment.user_id).filter(
                 or_(
@@ -160,12 +211,16 @@ def init_app(app):
                 )
             )
 
-        # Order appointments chronologically
-        appointments = query.order_by(Appointment.start_at.asc()).all()
+        # Order appointments chronologically and load one page of them
+        pagination = query.order_by(Appointment.start_at.asc()).paginate(
+            page=request.args.get("page", 1, type=int),
+            per_page=ADMIN_PAGE_SIZE,
+            error_out=False,
+        )
 
         # Group appointments by day to make the UI easier to read
         grouped_appointments = {}
-        for appt in appointments:
+        for appt in pagination.items:
             day = appt.start_at.date()
             grouped_appointments.setdefault(day, []).append(appt)
 
@@ -173,6 +228,7 @@ def init_app(app):
         return render_template(
             "admin_appointments.html",
             grouped_appointments=grouped_appointments,
+            pagination=pagination,
             q=q
         )
 
@@ -188,10 +244,10 @@ def init_app(app):
         q = request.args.get("q", "").strip().lower()
 
         # Query only past appointments
-        query = Appointment.query.options(joinedload(Appointment.user)) \
+        query = Appointment.query.options(selectinload(Appointment.user)) \
             .filter(Appointment.start_at < datetime.now())
 
-        # Apply search filtering
+        # Apply search filtering (trigram-indexed on Postgres, as above)
         if q:
             query = query.join(Account, Account.id == Appointment.user_id).filter(
                 or_(
@@ -201,12 +257,18 @@ def init_app(app):
                 )
             )
 
-        # Order by newest past appointment first
-        appointments = query.order_by(Appointment.start_at.desc()).all()
+        # Order by newest past appointment first and load one page of them
+        # (the archive only grows, so it is never loaded whole)
+        pagination = query.order_by(Appointment.start_at.desc()).paginate(
+            page=request.args.get("page", 1, type=int),
+            per_page=ADMIN_PAGE_SIZE,
+            error_out=False,
+        )
 
         return render_template(
             "admin_appointments_archive.html",
-            appointments=appointments,
+            appointments=pagination.items,
+            pagination=pagination,
             q=q
         )
 
@@ -219,7 +281,7 @@ def init_app(app):
     def admin_cancel_appointment(appointment_id):
 
         # Find appointment or return 404
-        appt = Appointment.query.get_or_404(appointment_id)
+        appt = db.get_or_404(Appointment, appointment_id)
 
         # If appointment is already in the past, redirect to archive instead
         if appt.start_at < datetime.now():
@@ -1,6 +1,9 @@
 # Flask utilities for rendering templates, handling requests, sessions, and redirects
 from flask import render_template, request, redirect, url_for, session
 
+# Case-insensitive email comparison (matches the lower(email) index)
+from sqlalchemy import exists, func
+
 # Werkzeug utilities for securely hashing and verifying passwords
 from werkzeug.security import check_password_hash, generate_password_hash
 
@@ -11,9 +14,24 @@ from .extensions import db
 from .models import Account
 
 
+# Default password hashing method for new accounts (PASSWORD_HASH_METHOD config).
+# scrypt is memory-hard and runs in C via hashlib; existing hashes keep
+# working because check_password_hash reads the method from each hash.
+PASSWORD_HASH_METHOD = "scrypt"
+
+
 # Register authentication-related routes with the Flask app
 def init_app(app):
 
+    # Hash method for this deployment, e.g. "scrypt:16384:8:1" or
+    # "pbkdf2:sha256:600000" to tune hashing cost to the host's CPU
+    hash_method = app.config.get("PASSWORD_HASH_METHOD") or PASSWORD_HASH_METHOD
+
+    # Precomputed hash checked when no account matches the submitted email.
+    # Running the same hash work on both paths keeps login response time from
+    # revealing which email addresses are registered.
+    dummy_hash = generate_password_hash("invalid", method=hash_method)
+
     # -----------------------------
     # HOME ROUTE
     # -----------------------------
@@ -37,18 +55,27 @@ def init_app(app):
             email = request.form.get("email", "").strip().lower()
             password = request.form.get("password", "")
 
-            # Look up active account with matching email
-            account = Account.query.filter_by(email=email, is_active=True).first()
+            # Look up account by email through the lower(email) unique index;
+            # the active flag is checked below instead of in the query
+            account = Account.query.filter(func.lower(Account.email) == email).first()
+
+            # Always verify a hash (dummy one if the account is missing)
+            # so unknown emails take as long as wrong passwords
+            hash_to_check = account.password_hash if account else dummy_hash
+            ok = check_password_hash(hash_to_check, password)
 
             # Verify password hash matches stored password
-            if account and check_password_hash(account.password_hash, password):
+            if account and account.is_active and ok:
 
                 # Clear any previous session data
                 session.clear()
 
                 # Store user identity and role in session
+                # (names are kept for display so pages need not reload the account)
                 session["role"] = account.role
                 session["account_id"] = account.id
+                session["first_name"] = account.first_name
+                session["last_name"] = account.last_name
 
                 # Redirect user based on role (role-based navigation)
                 if account.role == "admin":
@@ -88,8 +115,11 @@ def init_app(app):
                 return render_template("register.html", error=error)
 
             # Check if email is already registered
-            existing = Account.query.filter_by(email=email).first()
-            if existing:
+            # (EXISTS lets the database stop at the index entry without loading a row)
+            taken = db.session.query(
+                exists().where(func.lower(Account.email) == email)
+            ).scalar()
+            if taken:
                 error = "That email is already registered. Please log in."
                 return render_template("register.html", error=error)
 
@@ -100,7 +130,7 @@ def init_app(app):
                 phone=phone,
                 email=email,
                 # Store hashed password (never store plain text passwords)
-                password_hash=generate_password_hash(password),
+                password_hash=generate_password_hash(password, method=hash_method),
                 role="user",  # Default role for new accounts
                 is_active=True,
             )
@@ -113,6 +143,8 @@ def init_app(app):
             session.clear()
             session["account_id"] = new_account.id
             session["role"] = new_account.role
+            session["first_name"] = new_account.first_name
+            session["last_name"] = new_account.last_name
 
             # Redirect to booking page
             return redirect(url_for("book"))
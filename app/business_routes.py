@@ -1,25 +1,86 @@
 # Import datetime utilities for working with dates and times
-from datetime import datetime, time, timedelta
+from datetime import date, datetime, time, timedelta
+
+# Counter tallies appointments per day for reports
+from collections import Counter
+
+# Click writes CLI output consistently across terminals and test runners
+import click
 
 # Flask utilities for rendering templates, handling requests, and redirects
 from flask import redirect, render_template, request, url_for
 
 # Used to efficiently load related user data with appointments
-from sqlalchemy.orm import joinedload
+# (selectinload fetches all users in one extra IN query)
+from sqlalchemy.orm import selectinload
 
 # Custom helpers: role-based access control and time parsing
 from .decorators import parse_time_or_none, require_role
 
-# Database instance for committing changes
-from .extensions import db
+# Database instance for committing changes, plus ON CONFLICT-capable inserts
+from .extensions import db, dialect_insert
 
 # Database models used in this module
 from .models import Appointment, AvailabilityOverride, BusinessHour
 
+# Cached business hours and overrides must be refreshed whenever they change
+from .services.booking_service import clear_schedule_cache
+
+
+# Names of days for display in UI (index matches BusinessHour.weekday)
+DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Default hours for weekdays without a saved row
+DEFAULT_START_TIME = time(9, 0)
+DEFAULT_END_TIME = time(17, 0)
+
+# Weekdays closed by default (Saturday, Sunday)
+DEFAULT_CLOSED_DAYS = frozenset((5, 6))
+
+
+def ensure_default_business_hours():
+    """
+    Creates a default BusinessHour row for every weekday that has none.
+
+    Existing rows are left untouched (ON CONFLICT DO NOTHING), so this is
+    safe to run repeatedly and from concurrent processes.
+
+    Returns:
+        Number of rows inserted
+    """
+
+    stmt = dialect_insert(BusinessHour).values([
+        {
+            "weekday": i,
+            "start_time": DEFAULT_START_TIME,
+            "end_time": DEFAULT_END_TIME,
+            "is_closed": i in DEFAULT_CLOSED_DAYS,
+        }
+        for i in range(7)
+    ]).on_conflict_do_nothing(index_elements=["weekday"])
+
+    inserted = db.session.execute(stmt).rowcount
+    db.session.commit()
+
+    if inserted:
+        clear_schedule_cache()
+
+    return inserted
+
 
 # Register all business-related routes to the Flask app
 def init_app(app):
 
+    # -----------------------------
+    # CLI: DEFAULT BUSINESS HOURS
+    # -----------------------------
+    @app.cli.command("init-business-hours")
+    def init_business_hours_command():
+        """Create default weekly business hours for any missing weekday."""
+
+        inserted = ensure_default_business_hours()
+        click.echo(f"Created {inserted} default business hour row(s).")
+
     # -----------------------------
     # BUSINESS DASHBOARD (WEEKLY HOURS)
     # -----------------------------
@@ -27,41 +88,67 @@ def init_app(app):
     @require_role("business")  # Only business users can access this page
     def business_dashboard():
 
-        # Names of days for display in UI
-        day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-
         # Handle form submission (updating weekly hours)
         if request.method == "POST":
 
+            # Load existing hours in one query (used for fallback times).
+            # Plain column rows are enough here; no ORM objects are built.
+            existing = {
+                row.weekday: row
+                for row in db.session.execute(
+                    db.select(
+                        BusinessHour.weekday,
+                        BusinessHour.start_time,
+                        BusinessHour.end_time,
+                        BusinessHour.is_closed,
+                    )
+                )
+            }
+            values = []
+
             # Loop through all 7 days of the week
             for i in range(7):
                 closed = request.form.get(f"closed_{i}") == "on"
                 start_str = request.form.get(f"start_{i}", "")
                 end_str = request.form.get(f"end_{i}", "")
 
-                # Get existing row or create a new one if missing
-                row = BusinessHour.query.filter_by(weekday=i).first()
-                if not row:
-                    row = BusinessHour(
-                        weekday=i,
-                        start_time=time(9, 0),
-                        end_time=time(17, 0),
-                        is_closed=False,
-                    )
-                    db.session.add(row)
-
-                # Update closed/open status
-                if closed:
-                    row.is_closed = True
-                else:
-                    row.is_closed = False
+                # Start from existing times, or defaults for a missing row
+                row = existing.get(i)
+                start_time = row.start_time if row else DEFAULT_START_TIME
+                end_time = row.end_time if row else DEFAULT_END_TIME
+
+                # Parse input times for open days; fallback to existing/default values
+                if not closed:
+                    start_time = parse_time_or_none(start_str) or start_time
+                    end_time = parse_time_or_none(end_str) or end_time
+
+                # Skip days whose saved values did not change
+                if row and (row.start_time, row.end_time, row.is_closed) == (start_time, end_time, closed):
+                    continue
+
+                values.append({
+                    "weekday": i,
+                    "start_time": start_time,
+                    "end_time": end_time,
+                    "is_closed": closed,
+                })
 
-                    # Parse input times; fallback to existing/default values
-                    row.start_time = parse_time_or_none(start_str) or row.start_time or time(9, 0)
-                    row.end_time = parse_time_or_none(end_str) or row.end_time or time(17, 0)
+            # Insert missing days and update changed ones in a single statement
+            if values:
+                stmt = dialect_insert(BusinessHour).values(values)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["weekday"],
+                    set_={
+                        "start_time": stmt.excluded.start_time,
+                        "end_time": stmt.excluded.end_time,
+                        "is_closed": stmt.excluded.is_closed,
+                    },
+                )
+                db.session.execute(stmt)
 
-            # Save all updates at once
-            db.session.commit()
+                # Save all updates at once
+                db.session.commit()
+                clear_schedule_cache()
 
             # Redirect to refresh page and prevent resubmission
             return redirect(url_for("business_dashboard"))
@@ -70,30 +157,18 @@ def init_app(app):
         # LOAD CURRENT HOURS FOR DISPLAY
         # -----------------------------
         rows = {bh.weekday: bh for bh in BusinessHour.query.all()}
-        hours = []
-
-        # Ensure all 7 days exist in database
-        for i in range(7):
-            bh = rows.get(i)
-            if not bh:
-                # Default: weekends closed, weekdays open
-                default_closed = i in (5, 6)
-
-                bh = BusinessHour(
-                    weekday=i,
-                    start_time=time(9, 0),
-                    end_time=time(17, 0),
-                    is_closed=default_closed,
-                )
-                db.session.add(bh)
-                db.session.commit()
 
-            # Prepare data for template
-            hours.append({
-                "weekday": i,
-                "name": day_names[i],
-                "row": bh
-            })
+        # Rows are normally created by /seed or `flask init-business-hours`,
+        # so this page only writes on a database that was never initialized
+        if len(rows) < 7:
+            ensure_default_business_hours()
+            rows = {bh.weekday: bh for bh in BusinessHour.query.all()}
+
+        # Prepare data for template
+        hours = [
+            {"weekday": i, "name": DAY_NAMES[i], "row": rows[i]}
+            for i in range(7)
+        ]
 
         return render_template("business_dashboard.html", hours=hours)
 
@@ -116,7 +191,7 @@ def init_app(app):
 
             # Validate date input
             try:
-                override_date = datetime.fromisoformat(date_str).date()
+                override_date = date.fromisoformat(date_str)
             except ValueError:
                 error = "Please select a valid date."
                 overrides = AvailabilityOverride.query.order_by(AvailabilityOverride.date.asc()).all()
@@ -152,6 +227,7 @@ def init_app(app):
                 db.session.rollback()
             else:
                 db.session.commit()
+                clear_schedule_cache()
                 return redirect(url_for("business_overrides"))
 
         # Load all overrides sorted by date
@@ -167,11 +243,12 @@ def init_app(app):
     def delete_override(override_id):
 
         # Find override or return 404
-        row = AvailabilityOverride.query.get_or_404(override_id)
+        row = db.get_or_404(AvailabilityOverride, override_id)
 
         # Delete and save
         db.session.delete(row)
         db.session.commit()
+        clear_schedule_cache()
 
         return redirect(url_for("business_overrides"))
 
@@ -185,7 +262,7 @@ def init_app(app):
 
         # Query upcoming scheduled appointments
         appointments = (
-            Appointment.query.options(joinedload(Appointment.user))
+            Appointment.query.options(selectinload(Appointment.user))
             .filter(
                 Appointment.status == "scheduled",
                 Appointment.start_at >= datetime.now()
@@ -215,7 +292,7 @@ def init_app(app):
 
         # Query past appointments
         appointments = (
-            Appointment.query.options(joinedload(Appointment.user))
+            Appointment.query.options(selectinload(Appointment.user))
             .filter(
                 Appointment.status == "scheduled",
                 Appointment.start_at < datetime.now()
@@ -242,7 +319,7 @@ def init_app(app):
             return redirect(url_for("business_appointments"))
 
         # Retrieve appointment or return 404 if not found
-        appt = Appointment.query.get_or_404(appointment_id)
+        appt = db.get_or_404(Appointment, appointment_id)
 
         # If appointment is already in the past, redirect to archive view
         # (past appointments should not be modified)
@@ -285,62 +362,40 @@ def init_app(app):
         selected_delta = range_map.get(range_key, timedelta(days=7))
         range_start = now_dt - selected_delta
 
-        # Load all appointments with related user data
-        appointments = (
-            Appointment.query.options(joinedload(Appointment.user))
-            .order_by(Appointment.start_at.asc())
-            .all()
-        )
-
-        # Only include appointments whose appointment time falls inside the selected range
-        filtered_appointments = [
-            a for a in appointments
-            if range_start <= a.start_at <= now_dt
-        ]
-
-        # Separate filtered appointments by status
-        scheduled = [a for a in filtered_appointments if a.status == "scheduled"]
-        cancelled = [a for a in filtered_appointments if a.status == "cancelled"]
-
-        # Build one row per calendar day from the range start through today
-        # Only include days that actually have appointments, so the table stays compact
-        scheduled_by_day = []
-        cancelled_by_day = []
-
-        day_cursor = range_start.date()
-        end_date = now_dt.date()
-
-        while day_cursor <= end_date:
-            scheduled_count = sum(
-                1 for a in scheduled
-                if a.start_at.date() == day_cursor
+        # Load only the start time and status of appointments inside the selected range
+        # (the range filter runs in SQL; no Appointment objects or users are loaded)
+        rows = db.session.execute(
+            db.select(Appointment.start_at, Appointment.status).where(
+                Appointment.start_at >= range_start,
+                Appointment.start_at <= now_dt,
             )
-
-            cancelled_count = sum(
-                1 for a in cancelled
-                if a.start_at.date() == day_cursor
-            )
-
-            # Only add rows with non-zero counts
-            if scheduled_count > 0:
-                scheduled_by_day.append({
-                    "date": day_cursor,
-                    "count": scheduled_count,
-                })
-
-            if cancelled_count > 0:
-                cancelled_by_day.append({
-                    "date": day_cursor,
-                    "count": cancelled_count,
-                })
-
-            day_cursor += timedelta(days=1)
+        ).all()
+
+        # Count appointments per calendar day, separated by status, in a single pass
+        scheduled_counts = Counter()
+        cancelled_counts = Counter()
+        for start_at, status in rows:
+            if status == "scheduled":
+                scheduled_counts[start_at.date()] += 1
+            elif status == "cancelled":
+                cancelled_counts[start_at.date()] += 1
+
+        # One row per calendar day, oldest first
+        # Only days that actually have appointments are included, so the table stays compact
+        scheduled_by_day = [
+            {"date": day, "count": count}
+            for day, count in sorted(scheduled_counts.items())
+        ]
+        cancelled_by_day = [
+            {"date": day, "count": count}
+            for day, count in sorted(cancelled_counts.items())
+        ]
 
         return render_template(
             "business_reports.html",
-            total_appointments=len(filtered_appointments),
-            scheduled_count=len(scheduled),
-            cancelled_count=len(cancelled),
+            total_appointments=len(rows),
+            scheduled_count=sum(scheduled_counts.values()),
+            cancelled_count=sum(cancelled_counts.values()),
             scheduled_by_day=scheduled_by_day,
             cancelled_by_day=cancelled_by_day,
             selected_range=range_key,
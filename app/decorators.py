@@ -4,8 +4,62 @@ from datetime import time
 # wraps preserves original function metadata (important for Flask routing)
 from functools import wraps
 
-# Flask utilities for session management and redirects
-from flask import redirect, session, url_for
+# Flask utilities for session management, per-request storage, the running app, and redirects
+from flask import current_app, g, redirect, request, session, url_for
+
+# Database instance and Account model for loading the current user's row
+from .extensions import db
+from .models import Account
+
+
+# -----------------------------
+# CURRENT USER LOADER
+# -----------------------------
+def load_current_user():
+    """
+    Reads the logged-in user's role and account ID from the session once
+    per request and stores them on flask.g.
+
+    Registered as a before_request hook so the role decorator and the
+    views share a single session lookup.
+    """
+
+    g.role = session.get("role")
+    g.account_id = session.get("account_id")
+
+
+def current_account():
+    """
+    Returns the logged-in user's Account (or None), loaded on first use.
+
+    The row is cached on flask.g, so a request loads it at most once.
+    Requests that only need the role or ID use g.role / g.account_id
+    and never touch the database.
+    """
+
+    if "account" not in g:
+        g.account = db.session.get(Account, g.account_id) if g.account_id else None
+
+    return g.account
+
+
+def redirect_to_login():
+    """
+    Returns a redirect to the login page without rebuilding its URL
+    on every unauthorized request.
+
+    URLs are cached per app and per script root (mount prefix), since
+    url_for includes the prefix and the URL map does not change while
+    the app is running.
+    """
+
+    login_urls = current_app.extensions.setdefault("easybook_login_urls", {})
+
+    url = login_urls.get(request.script_root)
+    if url is None:
+        url = login_urls[request.script_root] = url_for("login")
+
+    return redirect(url)
 
 
 # -----------------------------
@@ -24,17 +78,30 @@ def require_role(*roles):
     """
 
     def decorator(view_func):
-        @wraps(view_func)  # Keeps original function name (important for Flask)
-        def wrapper(*args, **kwargs):
 
-            # Get current user's role from session
-            role = session.get("role")
+        # Most routes allow a single role, so compare it directly
+        if len(roles) == 1:
+            role_name = roles[0]
+
+            @wraps(view_func)  # Keeps original function name (important for Flask)
+            def wrapper(*args, **kwargs):
+
+                # If user is not authorized, redirect to login
+                if g.role != role_name:
+                    return redirect_to_login()
+
+                # Otherwise, allow access to the original route
+                return view_func(*args, **kwargs)
 
-            # If user is not authorized, redirect to login
-            if role not in roles:
-                return redirect(url_for("login"))
+            return wrapper
 
-            # Otherwise, allow access to the original route
+        # Several roles: check membership in a set built once
+        allowed = frozenset(roles)
+
+        @wraps(view_func)
+        def wrapper(*args, **kwargs):
+            if g.role not in allowed:
+                return redirect_to_login()
             return view_func(*args, **kwargs)
 
         return wrapper
@@ -47,7 +114,7 @@ def require_role(*roles):
 # -----------------------------
 def parse_time_or_none(value: str):
     """
-    Converts a string in "HH:MM" format into a Python time object.
+    Converts a string in "HH:MM" (or "HH:MM:SS") format into a Python time object.
 
     Returns:
         time object if valid input
@@ -60,12 +127,12 @@ def parse_time_or_none(value: str):
     Used for safely handling form input where time fields may be empty.
     """
 
-    # Validate input format
+    # Quick reject for empty or obviously malformed input
     if not value or ":" not in value:
         return None
 
-    # Split hours and minutes
-    h, m = value.split(":")
-
-    # Convert to integers and return time object
-    return time(int(h), int(m))
\ No newline at end of file
+    # Parse with the C-implemented ISO parser (also accepts "HH:MM:SS")
+    try:
+        return time.fromisoformat(value)
+    except ValueError:
+        return None
\ No newline at end of file
@@ -0,0 +1,60 @@
+# Flask utilities for per-request storage, the running app, and the current request
+from flask import current_app, g, has_request_context, request
+
+# SQLAlchemy event hooks for counting executed statements
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+# Most SQL statements each hot view should need, by (endpoint, HTTP method).
+# Budgets assume a cold schedule cache (hours + overrides reloaded).
+# Exceeding one usually means an eager load was dropped (an N+1 query).
+QUERY_COUNT_THRESHOLDS = {
+    ("admin_dashboard", "GET"): 3,
+    ("admin_appointments", "GET"): 3,
+    ("admin_appointments_archive", "GET"): 3,
+    ("business_appointments", "GET"): 2,
+    ("business_appointments_archive", "GET"): 2,
+    ("book", "GET"): 3,
+    ("book", "POST"): 4,
+}
+
+
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    """
+    Counts each SQL statement run while handling a request in debug mode.
+    """
+
+    if has_request_context() and current_app.debug:
+        g.query_count = g.get("query_count", 0) + 1
+
+
+def init_app(app):
+    """
+    Warns in debug mode when a hot view runs more queries than expected.
+
+    Debug mode is checked per request rather than at startup, because
+    run.py only turns it on in app.run(), after the app is created.
+    Outside debug mode the hooks return immediately.
+    """
+
+    # The listener is process-wide (all engines), so attach it only once
+    # even when several apps are created in the same process
+    if not event.contains(Engine, "before_cursor_execute", _count_query):
+        event.listen(Engine, "before_cursor_execute", _count_query)
+
+    @app.after_request
+    def warn_on_query_count(response):
+        if not current_app.debug:
+            return response
+
+        limit = QUERY_COUNT_THRESHOLDS.get((request.endpoint, request.method))
+        count = g.get("query_count", 0)
+
+        if limit is not None and count > limit:
+            app.logger.warning(
+                "%s %s ran %d SQL queries (expected at most %d); check for N+1 loading",
+                request.method, request.endpoint, count, limit,
+            )
+
+        return response
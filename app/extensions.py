@@ -1,6 +1,47 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine
 
 
 db = SQLAlchemy()
 migrate = Migrate()
+
+
+def dialect_insert(model):
+    """
+    Returns an INSERT for the active database that supports ON CONFLICT.
+
+    Postgres (production) and SQLite (local) each provide their own
+    insert() construct with on_conflict_do_update/on_conflict_do_nothing.
+    """
+
+    if db.engine.dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+
+@event.listens_for(Engine, "connect")
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    """
+    Tunes local SQLite connections for concurrent requests.
+
+    WAL lets slot listings read while a booking is being written, and the
+    longer busy timeout makes writers wait instead of failing with
+    "database is locked". Temporary tables/sorts stay in memory and the
+    database file is memory-mapped (up to 256 MB) to cut read syscalls.
+    Other databases (Postgres) are left untouched.
+    """
+
+    if not type(dbapi_conn).__module__.startswith("sqlite3"):
+        return
+
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
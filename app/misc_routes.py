@@ -1,8 +1,8 @@
 # Import OS module to access environment variables (used to detect production mode)
 import os
 
-# Flask utility to abort requests with HTTP status codes
-from flask import abort
+# Per-request storage holding the current user's role and account ID
+from flask import g
 
 # Used to securely hash passwords before storing them
 from werkzeug.security import generate_password_hash
@@ -13,10 +13,23 @@ from .extensions import db
 # Account model representing users in the system
 from .models import Account
 
+# Creates the default weekly hours rows
+from .business_routes import ensure_default_business_hours
+
+
+# Fast hash method for the well-known dev fixture passwords.
+# Real registrations use the deployment's PASSWORD_HASH_METHOD (scrypt by default).
+SEED_HASH_METHOD = "pbkdf2:sha256:50000"
+
 
 # Register development-only utility routes
 def init_app(app):
 
+    # In production these routes are not registered at all, so they return 404
+    # without any per-request environment check
+    if os.getenv("FLASK_ENV") == "production":
+        return
+
     # -----------------------------
     # DEBUG: WHO IS CURRENT USER
     # -----------------------------
@@ -27,20 +40,13 @@ def init_app(app):
 
         Useful for debugging authentication and session issues.
 
-        Disabled in production for security reasons.
+        Not registered in production for security reasons.
         """
 
-        # Prevent access in production environment
-        if os.getenv("FLASK_ENV") == "production":
-            abort(404)
-
-        # Import session here to avoid unnecessary global import
-        from flask import session
-
         # Return current session data (role + account ID)
         return {
-            "role": session.get("role"),
-            "account_id": session.get("account_id")
+            "role": g.role,
+            "account_id": g.account_id
         }
 
 
@@ -50,18 +56,15 @@ def init_app(app):
     @app.route("/seed")
     def seed():
         """
-        Seeds the database with default admin and business accounts.
+        Seeds the database with default admin and business accounts
+        and default weekly business hours.
 
         Only runs if the database is empty.
-        Disabled in production to prevent unauthorized data creation.
+        Not registered in production to prevent unauthorized data creation.
         """
 
-        # Prevent accidental execution in production
-        if os.getenv("FLASK_ENV") == "production":
-            abort(404)
-
         # If accounts already exist, do not seed again
-        if Account.query.first():
+        if db.session.execute(db.select(db.exists().select_from(Account))).scalar():
             return "Seed already done."
 
         # Create default admin account
@@ -71,7 +74,7 @@ def init_app(app):
             phone=None,
             email="admin@easybook.com",
             # Always store hashed passwords, never plain text
-            password_hash=generate_password_hash("password123"),
+            password_hash=generate_password_hash("password123", method=SEED_HASH_METHOD),
             role="admin",
             is_active=True,
         )
@@ -82,7 +85,7 @@ def init_app(app):
             last_name="Owner",
             phone=None,
             email="business@easybook.com",
-            password_hash=generate_password_hash("business123"),
+            password_hash=generate_password_hash("business123", method=SEED_HASH_METHOD),
             role="business",
             is_active=True,
         )
@@ -92,4 +95,7 @@ def init_app(app):
         db.session.add(business)
         db.session.commit()
 
+        # Create default weekly hours so the business dashboard is read-only
+        ensure_default_business_hours()
+
         return "Seeded admin and business."
\ No newline at end of file
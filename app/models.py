@@ -1,6 +1,9 @@
 # Import database instance used to define models and tables
 from .extensions import db
 
+# Normalizes attribute values whenever they are set on a model
+from sqlalchemy.orm import validates
+
 
 # -----------------------------
 # ACCOUNT MODEL
@@ -35,6 +38,10 @@ class Account(db.Model):
     # Used to disable accounts without deleting them
     is_active = db.Column(db.Boolean, default=True, nullable=False)
 
+    # Relationship: all appointments booked by this account
+    # lazy="raise": queries must eager-load it explicitly (no hidden N+1 queries)
+    appointments = db.relationship("Appointment", back_populates="user", lazy="raise")
+
     @property
     def full_name(self):
         """
@@ -44,6 +51,56 @@ class Account(db.Model):
         """
         return f"{self.first_name} {self.last_name}".strip()
 
+    @validates("email")
+    def normalize_email(self, key, value):
+        """
+        Stores emails trimmed and lowercased, whoever sets them,
+        so stored values always match the lower(email) lookups.
+        """
+        return value.strip().lower() if value else value
+
+
+# Case-insensitive uniqueness for emails; also the index used by
+# login/register lookups, which compare on lower(email)
+db.Index("ux_accounts_email_lower", db.func.lower(Account.email), unique=True)
+
+# Lowercased "first last email role" text used for admin account search on Postgres
+_SPACE = db.literal_column("' '")
+ACCOUNT_SEARCH_TEXT = db.func.lower(
+    Account.first_name + _SPACE + Account.last_name + _SPACE
+    + Account.email + _SPACE + Account.role
+)
+
+# Trigram index over ACCOUNT_SEARCH_TEXT so LIKE '%q%' can use it.
+# Postgres-only (needs the pg_trgm extension); skipped on SQLite.
+db.Index(
+    "ix_accounts_search_trgm",
+    ACCOUNT_SEARCH_TEXT.label("search_text"),
+    postgresql_using="gin",
+    postgresql_ops={"search_text": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+
+# Per-column trigram indexes for the admin appointment searches, which OR
+# ILIKE '%q%' over these columns (Postgres combines them with a BitmapOr)
+db.Index(
+    "ix_accounts_email_trgm",
+    Account.email,
+    postgresql_using="gin",
+    postgresql_ops={"email": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+db.Index(
+    "ix_accounts_first_name_trgm",
+    Account.first_name,
+    postgresql_using="gin",
+    postgresql_ops={"first_name": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+db.Index(
+    "ix_accounts_last_name_trgm",
+    Account.last_name,
+    postgresql_using="gin",
+    postgresql_ops={"last_name": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+
 
 # -----------------------------
 # APPOINTMENT MODEL
@@ -57,14 +114,32 @@ class Appointment(db.Model):
 
     __tablename__ = "appointments"
 
+    __table_args__ = (
+        # Only one scheduled appointment may exist per start time.
+        # Cancelled appointments are excluded so their slot can be rebooked.
+        db.Index(
+            "uq_appt_slot_scheduled",
+            "start_at",
+            unique=True,
+            sqlite_where=db.text("status = 'scheduled'"),
+            postgresql_where=db.text("status = 'scheduled'"),
+        ),
+        # Supports the booking window query (status = ? AND start_at range)
+        db.Index("ix_appt_status_start", "status", "start_at"),
+        # Supports "my appointments" (user_id = ? AND start_at >= ?, ordered by start_at)
+        # and, as its leftmost column, the user_id foreign key lookups
+        db.Index("ix_appt_user_start", "user_id", "start_at"),
+    )
+
     # Primary key
     id = db.Column(db.Integer, primary_key=True)
 
-    # Foreign key linking to Account table
+    # Foreign key linking to Account table (indexed by ix_appt_user_start)
     user_id = db.Column(db.Integer, db.ForeignKey("accounts.id"), nullable=False)
 
     # Appointment time range
-    start_at = db.Column(db.DateTime, nullable=False)
+    # start_at is indexed for the upcoming/past lists, which filter and sort on it alone
+    start_at = db.Column(db.DateTime, nullable=False, index=True)
     end_at = db.Column(db.DateTime, nullable=False)
 
     # Status allows tracking (e.g., scheduled, cancelled)
@@ -74,7 +149,8 @@ class Appointment(db.Model):
     created_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now())
 
     # Relationship: allows access to the user who owns the appointment
-    user = db.relationship("Account", backref="appointments")
+    # lazy="raise": list queries must use selectinload/joinedload(Appointment.user)
+    user = db.relationship("Account", back_populates="appointments", lazy="raise")
 
 
 # -----------------------------
@@ -121,6 +197,8 @@ class AvailabilityOverride(db.Model):
     id = db.Column(db.Integer, primary_key=True)
 
     # Specific date this override applies to (unique = one override per day)
+    # The unique constraint is backed by a B-tree index, which serves both
+    # the per-date lookups and ORDER BY date; no separate index is needed.
     date = db.Column(db.Date, unique=True, nullable=False)
 
     # Optional custom hours for that date
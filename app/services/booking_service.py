@@ -1,6 +1,24 @@
 # Import datetime utilities for date math and time range construction
 from datetime import datetime, timedelta, time
 
+# Binary search over sorted slot starts (skips past slots today)
+from bisect import bisect_left
+
+# Lightweight read-only record used to cache business hours between requests
+from collections import namedtuple
+
+# Memoizes slot start times for each set of opening hours
+from functools import lru_cache
+
+# Monotonic clock used to expire cached schedule data
+from time import monotonic
+
+# The running app, which owns its own schedule cache
+from flask import current_app
+
+# Database instance used for column-only (read-only) queries
+from ..extensions import db
+
 # Import models needed to read business hours, overrides, and existing appointments
 from ..models import Appointment, AvailabilityOverride, BusinessHour
 
@@ -8,6 +26,9 @@ from ..models import Appointment, AvailabilityOverride, BusinessHour
 # Fixed appointment length in minutes
 APPT_MINUTES = 30
 
+# Appointment length as a timedelta (built once at import)
+APPT_DELTA = timedelta(minutes=APPT_MINUTES)
+
 # Time between possible slot start times
 # In this project, slots move in 30-minute increments
 SLOT_STEP_MINUTES = 30
@@ -15,6 +36,119 @@ SLOT_STEP_MINUTES = 30
 # Number of future days shown in the booking window
 WINDOW_DAYS = 60
 
+# Cached copy of one BusinessHour row (same attribute names as the model)
+HoursRow = namedtuple("HoursRow", ["start_time", "end_time", "is_closed"])
+
+# Seconds before cached schedule data is reloaded from the database.
+# Writes in this process clear the cache right away; the TTL bounds how
+# long other worker processes can serve stale hours or overrides.
+SCHEDULE_CACHE_TTL = 60
+
+
+def _schedule_cache():
+    """
+    Returns the current app's schedule cache: {name: (loaded_at, value)}.
+
+    Kept in app.extensions so apps using different databases in one
+    process never share cached hours or overrides. "day_hours" is derived
+    from the other entries and stored as (today, value); it is dropped
+    whenever they are reloaded or cleared.
+    """
+
+    return current_app.extensions.setdefault("easybook_schedule_cache", {})
+
+
+def _cached(name, loader):
+    """
+    Returns the cached value for name, reloading it with loader()
+    when it is missing or older than SCHEDULE_CACHE_TTL seconds.
+    """
+
+    cache = _schedule_cache()
+    entry = cache.get(name)
+    now = monotonic()
+
+    if entry is None or now - entry[0] > SCHEDULE_CACHE_TTL:
+        entry = (now, loader())
+        cache[name] = entry
+
+        # Opening hours built from the old data are no longer valid
+        cache.pop("day_hours", None)
+
+    return entry[1]
+
+
+def _load_weekly_hours():
+    """
+    Loads weekly business hours from the database as {weekday: HoursRow}.
+    """
+
+    rows = db.session.execute(
+        db.select(
+            BusinessHour.weekday,
+            BusinessHour.start_time,
+            BusinessHour.end_time,
+            BusinessHour.is_closed,
+        )
+    )
+    return {
+        weekday: HoursRow(start_time, end_time, is_closed)
+        for weekday, start_time, end_time, is_closed in rows
+    }
+
+
+def _load_overrides():
+    """
+    Loads date-specific overrides from today onward as {date: row}.
+
+    Past overrides can never affect booking, so they are skipped.
+    Plain rows keep the model's attribute names without building ORM objects.
+    """
+
+    rows = db.session.execute(
+        db.select(
+            AvailabilityOverride.date,
+            AvailabilityOverride.start_time,
+            AvailabilityOverride.end_time,
+            AvailabilityOverride.is_closed,
+        ).where(AvailabilityOverride.date >= datetime.now().date())
+    )
+    return {row.date: row for row in rows}
+
+
+def get_weekly_hours():
+    """
+    Returns weekly business hours as {weekday: HoursRow}.
+
+    Served from memory for up to SCHEDULE_CACHE_TTL seconds,
+    saving a query on every booking page view.
+    """
+
+    return _cached("hours", _load_weekly_hours)
+
+
+def get_upcoming_overrides():
+    """
+    Returns date-specific overrides from today onward as {date: row}.
+
+    Cached for up to SCHEDULE_CACHE_TTL seconds and keyed by date,
+    so callers can look days up directly without rebuilding a dict.
+    """
+
+    return _cached("overrides", _load_overrides)
+
+
+def clear_schedule_cache():
+    """
+    Drops the current app's cached business hours and overrides
+    so its next request reloads them.
+
+    Must be called after any change to the business_hours or
+    availability_overrides tables.
+    """
+
+    _schedule_cache().clear()
+
 
 def get_booking_context(today=None, now_dt=None):
     """
@@ -26,7 +160,7 @@ def get_booking_context(today=None, now_dt=None):
         - current datetime
         - weekly business hours by weekday
         - date-specific overrides
-        - already-booked appointment start times grouped by date
+        - already-booked start times of day grouped by date
 
     This reduces repeated database queries when generating availability.
     """
@@ -40,39 +174,33 @@ def get_booking_context(today=None, now_dt=None):
     range_start = today
     range_end = today + timedelta(days=WINDOW_DAYS)
 
-    # Load weekly business hours and organize them by weekday number
+    # Weekly business hours organized by weekday number (cached)
     # Example: 0 = Monday, 6 = Sunday
-    bh_rows = BusinessHour.query.all()
-    bh_by_weekday = {bh.weekday: bh for bh in bh_rows}
-
-    # Load date-specific overrides only within the booking window
-    overrides = (
-        AvailabilityOverride.query.filter(
-            AvailabilityOverride.date >= range_start,
-            AvailabilityOverride.date <= range_end,
-        ).all()
-    )
-    ov_by_date = {ov.date: ov for ov in overrides}
+    bh_by_weekday = get_weekly_hours()
+
+    # Date-specific overrides by date (cached; only window days are looked up)
+    ov_by_date = get_upcoming_overrides()
 
     # Build datetime range for appointment lookup
     # Start at beginning of first day and end at beginning of day after range_end
     appt_start_dt = datetime.combine(range_start, time(0, 0))
     appt_end_dt = datetime.combine(range_end + timedelta(days=1), time(0, 0))
 
-    # Load scheduled appointments within the booking window
-    appts = (
-        Appointment.query.filter(
+    # Load only the start times of scheduled appointments within the booking window
+    # (selecting a single column skips building full Appointment objects)
+    booked_starts = db.session.execute(
+        db.select(Appointment.start_at).where(
             Appointment.status == "scheduled",
             Appointment.start_at >= appt_start_dt,
             Appointment.start_at < appt_end_dt,
-        ).all()
-    )
+        )
+    ).scalars()
 
-    # Group booked appointment start times by date for fast conflict checks
+    # Group booked start times of day by date for fast conflict checks
+    # (slot times are compared directly, without building datetimes)
     booked_starts_by_date = {}
-    for appt in appts:
-        day_date = appt.start_at.date()
-        booked_starts_by_date.setdefault(day_date, set()).add(appt.start_at)
+    for start_at in booked_starts:
+        booked_starts_by_date.setdefault(start_at.date(), set()).add(start_at.time())
 
     return {
         "today": today,
@@ -81,47 +209,11 @@ def get_booking_context(today=None, now_dt=None):
         "range_end": range_end,
         "bh_by_weekday": bh_by_weekday,
         "ov_by_date": ov_by_date,
+        "day_hours": _cached_day_hours(today, bh_by_weekday, ov_by_date),
         "booked_starts_by_date": booked_starts_by_date,
     }
 
 
-def is_open_day(day_date, bh_by_weekday, ov_by_date):
-    """
-    Determines whether the business is open on a given day.
-
-    Priority:
-        1. Date-specific override
-        2. Default weekly business hours
-
-    Returns:
-        True if the business is open on that date
-        False otherwise
-    """
-
-    # Overrides take priority over normal weekly hours
-    override = ov_by_date.get(day_date)
-    if override:
-        if override.is_closed:
-            return False
-
-        # Invalid override hours are treated as closed
-        if not override.start_time or not override.end_time or override.end_time <= override.start_time:
-            return False
-
-        return True
-
-    # If no override exists, use default weekly hours
-    business_hour = bh_by_weekday.get(day_date.weekday())
-    if not business_hour or business_hour.is_closed:
-        return False
-
-    # Invalid hours also count as closed
-    if business_hour.end_time <= business_hour.start_time:
-        return False
-
-    return True
-
-
 def get_day_hours(day_date, bh_by_weekday, ov_by_date):
     """
     Returns the opening and closing times for a given day.
@@ -155,10 +247,74 @@ def get_day_hours(day_date, bh_by_weekday, ov_by_date):
     return business_hour.start_time, business_hour.end_time
 
 
-def build_slots_for_day(day_date, bh_by_weekday, ov_by_date, booked_starts_by_date, now_dt):
+def build_day_hours(today, bh_by_weekday, ov_by_date):
+    """
+    Resolves opening hours for every day in the booking window in one pass.
+
+    Returns:
+        {date: (start_time, end_time)} for open days only, in date order.
+        A day is open exactly when it appears in the dictionary.
+    """
+
+    day_hours = {}
+
+    for i in range(0, WINDOW_DAYS + 1):
+        day_date = today + timedelta(days=i)
+        hours = get_day_hours(day_date, bh_by_weekday, ov_by_date)
+        if hours:
+            day_hours[day_date] = hours
+
+    return day_hours
+
+
+def _cached_day_hours(today, bh_by_weekday, ov_by_date):
+    """
+    Returns build_day_hours() for the cached schedule.
+
+    Opening hours only change when the schedule data is reloaded or the
+    date changes, so the result is stored next to the cached hours and
+    overrides and shared by every booking request until then.
+    Callers must not modify it.
+    """
+
+    cache = _schedule_cache()
+    entry = cache.get("day_hours")
+
+    if entry is None or entry[0] != today:
+        entry = (today, build_day_hours(today, bh_by_weekday, ov_by_date))
+        cache["day_hours"] = entry
+
+    return entry[1]
+
+
+@lru_cache(maxsize=32)
+def _slot_times(start_t, end_t, appt_minutes, step_minutes):
+    """
+    Returns every slot start time of day between opening and closing time.
+
+    Slots start at opening time, move forward in step_minutes increments,
+    and must leave room for a full appointment before closing time.
+    Only a handful of distinct opening hours exist, so results are cached
+    and each day just combines its date with these times.
+    """
+
+    # Work in seconds since midnight to avoid datetime arithmetic
+    open_sec = start_t.hour * 3600 + start_t.minute * 60 + start_t.second
+    close_sec = end_t.hour * 3600 + end_t.minute * 60 + end_t.second
+    last_start = close_sec - appt_minutes * 60
+
+    return tuple(
+        time(sec // 3600, sec % 3600 // 60, sec % 60)
+        for sec in range(open_sec, last_start + 1, step_minutes * 60)
+    )
+
+
+def build_slots_for_day(day_date, hours, booked_starts_by_date, now_dt):
     """
     Builds all available appointment start times for one day.
 
+    hours is the day's (start_time, end_time) tuple, or None if closed.
+
     Rules:
         - Slots must fit fully inside business hours
         - Slots cannot be in the past
@@ -169,37 +325,60 @@ def build_slots_for_day(day_date, bh_by_weekday, ov_by_date, booked_starts_by_da
         List of available datetime slot starts
     """
 
-    # Get opening hours for the selected day
-    hours = get_day_hours(day_date, bh_by_weekday, ov_by_date)
+    # Past days can never have bookable slots
+    today = now_dt.date()
+    if day_date < today:
+        return []
+
+    # Closed days have no slots
     if not hours:
         return []
 
     start_t, end_t = hours
 
-    # Convert opening/closing times into full datetimes
-    day_start = datetime.combine(day_date, start_t)
-    day_end = datetime.combine(day_date, end_t)
+    # Get all already-booked start times of day for this day
+    booked_starts = booked_starts_by_date.get(day_date, ())
 
-    # Get all already-booked start times for this day
-    booked_starts = booked_starts_by_date.get(day_date, set())
+    # Every possible slot start for these hours (cached per opening/closing pair)
+    times = _slot_times(start_t, end_t, APPT_MINUTES, SLOT_STEP_MINUTES)
 
-    slots = []
-    current = day_start
+    # Only today has slots in the past; times are sorted,
+    # so binary-search for the first slot that is not
+    if day_date == today:
+        times = times[bisect_left(times, now_dt.time()):]
 
-    # Keep generating slots while a full appointment still fits before closing time
-    while current + timedelta(minutes=APPT_MINUTES) <= day_end:
+    # Build datetimes only for unbooked slots
+    return [datetime.combine(day_date, t) for t in times if t not in booked_starts]
 
-        # Only include future, unbooked slots
-        if current >= now_dt and current not in booked_starts:
-            slots.append(current)
 
-        # Move to next possible slot start
-        current += timedelta(minutes=SLOT_STEP_MINUTES)
+def day_has_slots(day_date, hours, booked_starts_by_date, now_dt):
+    """
+    Returns True if at least one slot on this day can still be booked.
+
+    Cheaper than build_slots_for_day for the calendar: it stops at the
+    first free slot and never builds datetimes.
+    """
 
-    return slots
+    # Closed days and past days have no slots
+    today = now_dt.date()
+    if not hours or day_date < today:
+        return False
 
+    times = _slot_times(hours[0], hours[1], APPT_MINUTES, SLOT_STEP_MINUTES)
 
-def build_calendar_data(today, bh_by_weekday, ov_by_date, booked_starts_by_date, now_dt):
+    # Skip slot times that have already passed today
+    if day_date == today:
+        times = times[bisect_left(times, now_dt.time()):]
+
+    # With nothing booked, any remaining slot time is free
+    booked_starts = booked_starts_by_date.get(day_date)
+    if not booked_starts:
+        return bool(times)
+
+    return any(t not in booked_starts for t in times)
+
+
+def build_calendar_data(day_hours, booked_starts_by_date, now_dt):
     """
     Builds booking calendar data for the full booking window.
 
@@ -209,23 +388,20 @@ def build_calendar_data(today, bh_by_weekday, ov_by_date, booked_starts_by_date,
         available_dates:
             Dates that have at least one open booking slot
 
-    This is used to drive the booking calendar UI.
+    This is used to drive the booking calendar UI. Full slot lists are
+    only built for the day the user is looking at.
     """
 
     open_dates = []
     available_dates = []
 
-    # Check each day in the booking window
-    for i in range(0, WINDOW_DAYS + 1):
-        day_date = today + timedelta(days=i)
-
-        # Add day to open_dates if business is open
-        if is_open_day(day_date, bh_by_weekday, ov_by_date):
-            iso_date = day_date.isoformat()
-            open_dates.append(iso_date)
+    # day_hours only holds open days, already in date order
+    for day_date, hours in day_hours.items():
+        iso_date = day_date.isoformat()
+        open_dates.append(iso_date)
 
-            # Only add to available_dates if at least one slot exists
-            if build_slots_for_day(day_date, bh_by_weekday, ov_by_date, booked_starts_by_date, now_dt):
-                available_dates.append(iso_date)
+        # Only add to available_dates if at least one slot exists
+        if day_has_slots(day_date, hours, booked_starts_by_date, now_dt):
+            available_dates.append(iso_date)
 
-    return open_dates, available_dates
\ No newline at end of file
+    return open_dates, available_dates
@@ -1,24 +1,28 @@
-# Import datetime utilities for working with dates and time calculations
-from datetime import datetime, timedelta
+# Import datetime utilities for working with dates and times
+from datetime import date, datetime
 
-# Flask utilities for request handling, sessions, redirects, and templates
-from flask import abort, redirect, render_template, request, session, url_for
+# Hashing for the booking page ETag
+import hashlib
+
+# Flask utilities for request handling, the current user, redirects, and templates
+from flask import abort, g, make_response, redirect, render_template, request, stream_template, url_for
 
 # Custom decorator for role-based access control
 from .decorators import require_role
 
-# Database instance for committing changes
-from .extensions import db
+# Database instance and dialect-aware INSERT (for ON CONFLICT)
+from .extensions import db, dialect_insert
 
 # Appointment model for querying and creating bookings
 from .models import Appointment
 
 # Booking logic helpers (separated for cleaner code and reuse)
 from .services.booking_service import (
-    APPT_MINUTES,
+    APPT_DELTA,
     build_calendar_data,
     build_slots_for_day,
     get_booking_context,
+    get_day_hours,
 )
 
 
@@ -35,7 +39,7 @@ def init_app(app):
         # Query future scheduled appointments for the logged-in user
         appointments = (
             Appointment.query.filter(
-                Appointment.user_id == session.get("account_id"),
+                Appointment.user_id == g.account_id,
                 Appointment.status == "scheduled",
                 Appointment.start_at >= datetime.now(),
             )
@@ -55,12 +59,12 @@ def init_app(app):
 
         # Retrieve the appointment from the database
         # If it doesn't exist, Flask will automatically return a 404 error
-        appt = Appointment.query.get_or_404(appointment_id)
+        appt = db.get_or_404(Appointment, appointment_id)
 
         # Security check:
         # Ensure the logged-in user owns this appointment
         # Prevents users from cancelling other users' appointments
-        if appt.user_id != session.get("account_id"):
+        if appt.user_id != g.account_id:
             abort(403)  # Forbidden access
 
         # Instead of deleting the appointment, mark it as cancelled
@@ -92,6 +96,7 @@ def init_app(app):
         now_dt = context["now_dt"]
         bh_by_weekday = context["bh_by_weekday"]
         ov_by_date = context["ov_by_date"]
+        day_hours = context["day_hours"]
         booked_starts_by_date = context["booked_starts_by_date"]
 
         # -----------------------------
@@ -124,27 +129,37 @@ def init_app(app):
                 error = "You cannot book an appointment in the past."
             else:
                 # Calculate end time based on fixed appointment duration
-                end_at = start_at + timedelta(minutes=APPT_MINUTES)
-
-                # Check for conflicts (double-booking prevention)
-                existing = Appointment.query.filter_by(
-                    start_at=start_at,
-                    status="scheduled"
-                ).first()
-
-                if existing:
-                    error = "Sorry, that slot was just booked. Please choose another."
-                else:
-                    # Create new appointment
-                    appt = Appointment(
-                        user_id=session.get("account_id"),
+                end_at = start_at + APPT_DELTA
+
+                # Insert the appointment in one statement. The unique slot index
+                # rejects double-bookings (even when two users submit the same
+                # slot at once); ON CONFLICT DO NOTHING turns that into no row
+                # returned instead of an error.
+                stmt = (
+                    dialect_insert(Appointment)
+                    .values(
+                        user_id=g.account_id,
                         start_at=start_at,
                         end_at=end_at,
                         status="scheduled",
                     )
-                    db.session.add(appt)
-                    db.session.commit()
+                    .on_conflict_do_nothing(
+                        index_elements=["start_at"],
+                        # Same predicate as the uq_appt_slot_scheduled index
+                        index_where=db.text("status = 'scheduled'"),
+                    )
+                    .returning(Appointment.id)
+                )
+                new_id = db.session.execute(stmt).scalar()
+                db.session.commit()
 
+                if new_id is None:
+                    error = "Sorry, that slot was just booked. Please choose another."
+
+                    # The booking data was loaded before this insert,
+                    # so mark the slot as taken for the page rendered below
+                    booked_starts_by_date.setdefault(start_at.date(), set()).add(start_at.time())
+                else:
                     # Show confirmation page
                     return render_template("booking_success.html", start_at=start_at)
 
@@ -152,11 +167,17 @@ def init_app(app):
         # BUILD CALENDAR DATA
         # -----------------------------
         open_dates, available_dates = build_calendar_data(
-            today, bh_by_weekday, ov_by_date, booked_starts_by_date, now_dt
+            day_hours, booked_starts_by_date, now_dt
         )
 
-        # Earliest available booking date
+        # Sets for O(1) membership checks (the lists keep calendar order for the template)
+        open_set = set(open_dates)
+        available_set = set(available_dates)
+        today_iso = today.isoformat()
+
+        # Earliest available booking date (parsed once, reused by every redirect below)
         soonest_available = available_dates[0] if available_dates else None
+        soonest_day = date.fromisoformat(soonest_available) if soonest_available else None
         redirected_message = None
 
         # -----------------------------
@@ -164,58 +185,89 @@ def init_app(app):
         # -----------------------------
         if selected_date:
             try:
-                day = datetime.fromisoformat(selected_date).date()
+                day = date.fromisoformat(selected_date)
             except ValueError:
                 day = today
-                selected_date = day.isoformat()
 
             # Prevent selecting past dates
             if day < today:
                 day = today
-                selected_date = day.isoformat()
+
+            # Normalize so the string matches the calendar's ISO dates
+            selected_date = day.isoformat()
 
             # If business is closed → redirect to next available date
-            if soonest_available and selected_date not in open_dates:
+            if soonest_available and selected_date not in open_set:
                 redirected_message = "This business is not open this day. You have returned to the soonest appointment."
                 selected_date = soonest_available
-                day = datetime.fromisoformat(selected_date).date()
+                day = soonest_day
 
             # If open but fully booked → also redirect
-            elif soonest_available and selected_date in open_dates and selected_date not in available_dates:
+            elif soonest_available and selected_date not in available_set:
                 redirected_message = "No appointments available for this day. You have returned to the soonest appointment."
                 selected_date = soonest_available
-                day = datetime.fromisoformat(selected_date).date()
+                day = soonest_day
 
         else:
             # Default: pick first available date
             if soonest_available:
                 selected_date = soonest_available
-                day = datetime.fromisoformat(selected_date).date()
+                day = soonest_day
             else:
                 day = today
-                selected_date = day.isoformat()
+                selected_date = today_iso
 
         # -----------------------------
         # GENERATE TIME SLOTS
         # -----------------------------
-        slots = build_slots_for_day(
+        # Use the precomputed hours when the day is inside the booking window
+        day_slots = build_slots_for_day(
             day,
-            bh_by_weekday,
-            ov_by_date,
+            day_hours.get(day) or get_day_hours(day, bh_by_weekday, ov_by_date),
             booked_starts_by_date,
             now_dt
         )
 
+        # Format each slot once here as (form value, button label)
+        # instead of calling isoformat/strftime inside the template
+        slots = [(slot.isoformat(), slot.strftime("%I:%M %p")) for slot in day_slots]
+
         # Show redirect message as error (reuses UI space)
         if redirected_message and not error:
             error = redirected_message
 
-        return render_template(
+        # Let browsers revalidate a repeated GET instead of downloading it again.
+        # The ETag covers everything the template shows, so any booking,
+        # cancellation, schedule change, or passing slot produces a new one.
+        # "no-cache" makes the browser always ask first, so a slot booked a
+        # moment ago is never shown from a stale copy.
+        etag = None
+        if request.method == "GET":
+            page_state = repr((selected_date, error, today_iso, slots, available_dates, open_dates))
+            # Not a security hash; the flag keeps it working on FIPS-mode builds
+            etag = hashlib.md5(page_state.encode(), usedforsecurity=False).hexdigest()
+
+            # Unchanged page: answer 304 without rendering the template
+            if request.if_none_match.contains(etag):
+                response = make_response("", 304)
+                response.set_etag(etag)
+                response.headers["Cache-Control"] = "private, no-cache"
+                return response
+
+        # Stream the page so the browser can start parsing it while it renders
+        # (make_conditional is not used: it would buffer the whole stream)
+        response = make_response(stream_template(
             "book_slots.html",
             selected_date=selected_date,
             slots=slots,
             error=error,
-            today=today.isoformat(),
+            today=today_iso,
             available_dates=available_dates,
             open_dates=open_dates,
-        )
\ No newline at end of file
+        ))
+
+        if etag:
+            response.set_etag(etag)
+            response.headers["Cache-Control"] = "private, no-cache"
+
+        return response
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""add accounts search trigram index
+
+Revision ID: 1ace6ad73e8d
+Revises: 96995f9204c1
+Create Date: 2026-10-15 15:02:44.318907
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1ace6ad73e8d'
+down_revision = '96995f9204c1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Trigram indexes are Postgres-only; SQLite keeps the plain ILIKE search
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # Same expression as ACCOUNT_SEARCH_TEXT / ix_accounts_search_trgm in app/models.py
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_accounts_search_trgm ON accounts USING gin "
+        "((lower(first_name || ' ' || last_name || ' ' || email || ' ' || role)) gin_trgm_ops)"
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("DROP INDEX IF EXISTS ix_accounts_search_trgm")
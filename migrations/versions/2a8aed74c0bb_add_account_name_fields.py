@@ -19,8 +19,13 @@ def upgrade():
     op.execute("ALTER TABLE accounts ADD COLUMN IF NOT EXISTS last_name VARCHAR(80)")
     op.execute("ALTER TABLE accounts ADD COLUMN IF NOT EXISTS phone VARCHAR(30)")
     op.execute("ALTER TABLE accounts DROP COLUMN IF EXISTS name")
-    op.execute("UPDATE accounts SET first_name = COALESCE(first_name, 'Unknown')")
-    op.execute("UPDATE accounts SET last_name  = COALESCE(last_name,  'User')")
+    # Backfill both names in one pass, touching only rows that need it
+    op.execute(
+        "UPDATE accounts SET "
+        "first_name = COALESCE(first_name, 'Unknown'), "
+        "last_name  = COALESCE(last_name,  'User') "
+        "WHERE first_name IS NULL OR last_name IS NULL"
+    )
     op.execute("ALTER TABLE accounts ALTER COLUMN first_name SET NOT NULL")
     op.execute("ALTER TABLE accounts ALTER COLUMN last_name  SET NOT NULL")
 
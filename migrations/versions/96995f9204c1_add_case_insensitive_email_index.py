@@ -0,0 +1,30 @@
+"""add case insensitive email index
+
+Revision ID: 96995f9204c1
+Revises: c9740415dae0
+Create Date: 2026-10-15 14:37:09.551820
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '96995f9204c1'
+down_revision = 'c9740415dae0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Login/register now look accounts up by lower(email), which this index serves;
+    # the (email, is_active) index is no longer used by any query
+    op.create_index('ux_accounts_email_lower', 'accounts', [sa.text('lower(email)')], unique=True)
+    with op.batch_alter_table('accounts', schema=None) as batch_op:
+        batch_op.drop_index('ix_accounts_email_active')
+
+
+def downgrade():
+    with op.batch_alter_table('accounts', schema=None) as batch_op:
+        batch_op.create_index('ix_accounts_email_active', ['email', 'is_active'], unique=False)
+    op.drop_index('ux_accounts_email_lower', table_name='accounts')
@@ -0,0 +1,42 @@
+"""add accounts name email trigram indexes
+
+Revision ID: b4d27e9a6f13
+Revises: 5e0b3f8c21d7
+Create Date: 2026-10-15 17:08:26.740193
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4d27e9a6f13'
+down_revision = '5e0b3f8c21d7'
+branch_labels = None
+depends_on = None
+
+
+# Columns searched with ILIKE '%q%' by the admin appointment lists
+TRGM_COLUMNS = ("email", "first_name", "last_name")
+
+
+def upgrade():
+    # Trigram indexes are Postgres-only; SQLite keeps the plain ILIKE search
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # One index per column so the OR'd ILIKE predicates become a BitmapOr
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in TRGM_COLUMNS:
+        op.execute(
+            f"CREATE INDEX ix_accounts_{column}_trgm ON accounts "
+            f"USING gin ({column} gin_trgm_ops)"
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for column in TRGM_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS ix_accounts_{column}_trgm")